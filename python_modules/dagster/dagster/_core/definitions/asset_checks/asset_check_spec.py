@@ -1,5 +1,6 @@
 from collections.abc import Iterable, Mapping
 from enum import Enum
+from functools import cached_property
 from typing import TYPE_CHECKING, Annotated, Any, Optional, Union
 
 from dagster_shared.record import (
@@ -126,7 +127,7 @@ def get_python_identifier(self) -> str:
         """
         return f"{self.asset_key.to_python_identifier()}_{self.name}".replace(".", "_")
 
-    @property
+    @cached_property
     def key(self) -> AssetCheckKey:
         return AssetCheckKey(self.asset_key, self.name)
 
@@ -974,7 +974,7 @@ def node_check_specs_by_output_name(self) -> Mapping[str, AssetCheckSpec]:
         """AssetCheckSpec for each output on the underlying NodeDefinition."""
         return self._check_specs_by_output_name
 
-    @property
+    @cached_property
     def check_specs_by_output_name(self) -> Mapping[str, AssetCheckSpec]:
         return {
             name: spec
@@ -1142,7 +1142,7 @@ def get_partition_mapping(self, in_asset_key: AssetKey) -> Optional[PartitionMap
         return self._partition_mappings.get(in_asset_key)
 
     @public
-    @property
+    @cached_property
     def check_specs(self) -> Iterable[AssetCheckSpec]:
         """Returns the asset check specs defined on this AssetsDefinition, i.e. the checks that can
         be executed while materializing the assets.
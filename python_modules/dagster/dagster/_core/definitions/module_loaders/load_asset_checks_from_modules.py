@@ -1,10 +1,8 @@
-import inspect
 from collections.abc import Iterable, Sequence
 from importlib import import_module
 from types import ModuleType
 from typing import Optional
 
-import dagster._check as check
 from dagster._core.definitions.asset_checks.asset_checks_definition import AssetChecksDefinition
 from dagster._core.definitions.asset_key import (
     CoercibleToAssetKeyPrefix,
@@ -12,7 +10,10 @@
 )
 from dagster._core.definitions.assets.definition.assets_definition import AssetsDefinition
 from dagster._core.definitions.module_loaders.object_list import ModuleScopedDagsterDefs
-from dagster._core.definitions.module_loaders.utils import find_modules_in_package
+from dagster._core.definitions.module_loaders.utils import (
+    find_caller_module,
+    find_modules_in_package,
+)
 
 
 def load_asset_checks_from_modules(
@@ -65,10 +66,7 @@ def load_asset_checks_from_current_module(
         Sequence[AssetChecksDefinition]:
             A list containing asset checks defined in the current module.
     """
-    caller = inspect.stack()[1]
-    module = inspect.getmodule(caller[0])
-    if module is None:
-        check.failed("Could not find a module for the caller")
+    module = find_caller_module()
 
     asset_key_prefix = check_opt_coercible_to_asset_key_prefix_param(
         asset_key_prefix, "asset_key_prefix"
@@ -1,4 +1,3 @@
-import inspect
 from collections.abc import Iterable, Iterator, Sequence
 from importlib import import_module
 from types import ModuleType
@@ -22,7 +21,10 @@
 )
 from dagster._core.definitions.freshness_policy import LegacyFreshnessPolicy
 from dagster._core.definitions.module_loaders.object_list import ModuleScopedDagsterDefs
-from dagster._core.definitions.module_loaders.utils import find_modules_in_package
+from dagster._core.definitions.module_loaders.utils import (
+    find_caller_module,
+    find_modules_in_package,
+)
 from dagster._core.definitions.source_asset import SourceAsset
 from dagster._core.definitions.utils import resolve_automation_condition
 
@@ -157,10 +159,7 @@ def load_assets_from_current_module(
         Sequence[Union[AssetsDefinition, SourceAsset, CachableAssetsDefinition]]:
             A list containing assets, source assets, and cacheable assets defined in the module.
     """
-    caller = inspect.stack()[1]
-    module = inspect.getmodule(caller[0])
-    if module is None:
-        check.failed("Could not find a module for the caller")
+    module = find_caller_module()
 
     return load_assets_from_modules(
         [module],
@@ -1,16 +1,17 @@
-import inspect
 from collections.abc import Iterable, Mapping
 from importlib import import_module
 from types import ModuleType
 from typing import Any, Optional, Union
 
-import dagster._check as check
 from dagster._annotations import preview
 from dagster._core.definitions.definitions_class import Definitions
 from dagster._core.definitions.executor_definition import ExecutorDefinition
 from dagster._core.definitions.logger_definition import LoggerDefinition
 from dagster._core.definitions.module_loaders.object_list import ModuleScopedDagsterDefs
-from dagster._core.definitions.module_loaders.utils import find_modules_in_package
+from dagster._core.definitions.module_loaders.utils import (
+    find_caller_module,
+    find_modules_in_package,
+)
 from dagster._core.executor.base import Executor
 
 
@@ -97,10 +98,7 @@ def load_definitions_from_current_module(
         Definitions:
             The :py:class:`dagster.Definitions` defined in the current module.
     """
-    caller = inspect.stack()[1]
-    module = inspect.getmodule(caller[0])
-    if module is None:
-        check.failed("Could not find a module for the caller")
+    module = find_caller_module()
 
     return load_definitions_from_modules(
         modules=[module], resources=resources, loggers=loggers, executor=executor
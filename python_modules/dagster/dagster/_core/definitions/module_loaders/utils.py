@@ -1,9 +1,11 @@
+import inspect
 import pkgutil
 from collections.abc import Iterable, Iterator, Mapping
 from importlib import import_module
 from types import ModuleType
 from typing import Union
 
+import dagster._check as check
 from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.definitions.assets.definition.asset_spec import AssetSpec
 from dagster._core.definitions.assets.definition.assets_definition import AssetsDefinition
@@ -34,6 +36,25 @@ def find_subclasses_in_module(
             yield value
 
 
+def find_caller_module() -> ModuleType:
+    """Returns the module containing the caller of the function that invokes this one.
+
+    Walks the frame chain directly rather than using inspect.stack(), which resolves source context
+    for every frame on the stack and dominates the cost of loading from the current module.
+    """
+    frame = inspect.currentframe()
+    caller_frame = None
+    try:
+        caller_frame = frame.f_back.f_back if frame and frame.f_back else None
+        module = inspect.getmodule(caller_frame) if caller_frame else None
+    finally:
+        # break the reference cycle between this frame and the frames it holds, see the inspect docs
+        del frame, caller_frame
+    if module is None:
+        check.failed("Could not find a module for the caller")
+    return module
+
+
 def key_iterator(
     asset: Union[AssetsDefinition, SourceAsset, AssetSpec], included_targeted_keys: bool = False
 ) -> Iterator[AssetKey]:
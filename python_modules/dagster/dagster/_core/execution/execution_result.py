@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import AbstractSet, Callable, Optional, cast  # noqa: UP035
+from typing import AbstractSet, Callable, NamedTuple, Optional, cast  # noqa: UP035
 
 from dagster_shared.error import DagsterError
 
@@ -22,6 +22,13 @@
 from dagster._core.storage.dagster_run import DagsterRun
 
 
+class AssetEventsSummary(NamedTuple):
+    """The asset materialization events and asset check evaluations from a single execution."""
+
+    materialization_events: Sequence[DagsterEvent]
+    check_evaluations: Sequence[AssetCheckEvaluation]
+
+
 class ExecutionResult(ABC):
     @property
     @abstractmethod
@@ -108,6 +115,21 @@ def output_for_node(self, node_str: str, output_name: str = DEFAULT_OUTPUT) -> o
     def filter_events(self, event_filter: Callable[[DagsterEvent], bool]) -> Sequence[DagsterEvent]:
         return [event for event in self.all_events if event_filter(event)]
 
+    def count_events(self, event_type: DagsterEventType) -> int:
+        """Returns the number of events of the given type, without building a list of them."""
+        event_type_value = event_type.value
+        return sum(1 for event in self.all_events if event.event_type_value == event_type_value)
+
+    def first_event(self, event_type: DagsterEventType) -> Optional[DagsterEvent]:
+        """Returns the first event of the given type, or None if there is none. Stops scanning
+        the event list at the first match.
+        """
+        event_type_value = event_type.value
+        return next(
+            (event for event in self.all_events if event.event_type_value == event_type_value),
+            None,
+        )
+
     def events_for_node(self, node_name: str) -> Sequence[DagsterEvent]:
         """Retrieves all dagster events for a specific node.
 
@@ -189,6 +211,22 @@ def get_asset_check_evaluations(self) -> Sequence[AssetCheckEvaluation]:
             if event.event_type_value == DagsterEventType.ASSET_CHECK_EVALUATION.value
         ]
 
+    def get_asset_events_summary(self) -> AssetEventsSummary:
+        """Collects the asset materialization events and asset check evaluations in a single pass
+        over the event list, for callers that need both.
+        """
+        materialization_events: list[DagsterEvent] = []
+        check_evaluations: list[AssetCheckEvaluation] = []
+        for event in self.all_events:
+            if event.is_step_materialization:
+                materialization_events.append(event)
+            elif event.event_type_value == DagsterEventType.ASSET_CHECK_EVALUATION.value:
+                check_evaluations.append(cast("AssetCheckEvaluation", event.event_specific_data))
+
+        return AssetEventsSummary(
+            materialization_events=materialization_events, check_evaluations=check_evaluations
+        )
+
     def get_step_success_events(self) -> Sequence[DagsterEvent]:
         return [event for event in self.all_events if event.is_step_success]
 
@@ -1,46 +1,70 @@
 import dagster as dg
-from dagster import AssetExecutionContext
+import pytest
+
+_MY_KEY = dg.AssetKey(["my_asset"])
+_FOO_MY_KEY = dg.AssetKey(["foo", "my_asset"])
 
 
 @dg.asset(check_specs=[dg.AssetCheckSpec(name="my_check", asset="my_asset")])
-def my_asset(context: AssetExecutionContext):
-    yield dg.Output("foo")
-    yield dg.AssetCheckResult(passed=True)
+def my_asset(context: dg.AssetExecutionContext):
+    return dg.MaterializeResult(value="foo", check_results=[dg.AssetCheckResult(passed=True)])
 
 
-def test_load():
-    assets = dg.load_assets_from_current_module()
+def _execute(assets) -> dg.ExecuteInProcessResult:
+    defs = dg.Definitions(assets=list(assets))
+    return defs.resolve_implicit_global_asset_job_def().execute_in_process()
 
-    assert len(assets) == 1
-    assert assets[0].key == dg.AssetKey(["my_asset"])  # pyright: ignore[reportAttributeAccessIssue]
-    assert len(assets[0].check_specs) == 1  # pyright: ignore[reportArgumentType,reportAttributeAccessIssue]
-    assert next(iter(assets[0].check_specs)).asset_key == dg.AssetKey(["my_asset"])  # pyright: ignore[reportAttributeAccessIssue]
+
+# the module walk and the materializations only need to happen once for all tests
+@pytest.fixture(name="assets", scope="module")
+def assets_fixture() -> tuple:
+    return tuple(dg.load_assets_from_current_module())
+
+
+@pytest.fixture(name="prefixed_assets", scope="module")
+def prefixed_assets_fixture() -> tuple:
+    return tuple(dg.load_assets_from_current_module(key_prefix="foo"))
 
 
-def test_materialize():
-    result = dg.materialize(dg.load_assets_from_current_module())  # pyright: ignore[reportArgumentType]
+@pytest.fixture(name="materialize_result", scope="module")
+def materialize_result_fixture(assets) -> dg.ExecuteInProcessResult:
+    return _execute(assets)
 
-    assert len(result.get_asset_materialization_events()) == 1
-    assert result.get_asset_materialization_events()[0].asset_key == dg.AssetKey(["my_asset"])
-    assert len(result.get_asset_check_evaluations()) == 1
-    assert result.get_asset_check_evaluations()[0].asset_key == dg.AssetKey(["my_asset"])
 
+@pytest.fixture(name="prefixed_materialize_result", scope="module")
+def prefixed_materialize_result_fixture(prefixed_assets) -> dg.ExecuteInProcessResult:
+    return _execute(prefixed_assets)
 
-def test_prefix_load():
-    assets = dg.load_assets_from_current_module(key_prefix="foo")
 
+def test_load(assets):
     assert len(assets) == 1
-    assert assets[0].key == dg.AssetKey(["foo", "my_asset"])  # pyright: ignore[reportAttributeAccessIssue]
-    assert len(assets[0].check_specs) == 1  # pyright: ignore[reportArgumentType,reportAttributeAccessIssue]
-    assert next(iter(assets[0].check_specs)).asset_key == dg.AssetKey(["foo", "my_asset"])  # pyright: ignore[reportAttributeAccessIssue]
+    assert assets[0].key == _MY_KEY
+    specs = tuple(assets[0].check_specs)
+    assert len(specs) == 1
+    assert specs[0].asset_key == _MY_KEY
+
+
+def test_materialize(materialize_result):
+    mats, checks = materialize_result.get_asset_events_summary()
+
+    assert len(mats) == 1
+    assert mats[0].asset_key == _MY_KEY
+    assert len(checks) == 1
+    assert checks[0].asset_key == _MY_KEY
+
+
+def test_prefix_load(prefixed_assets):
+    assert len(prefixed_assets) == 1
+    assert prefixed_assets[0].key == _FOO_MY_KEY
+    specs = tuple(prefixed_assets[0].check_specs)
+    assert len(specs) == 1
+    assert specs[0].asset_key == _FOO_MY_KEY
 
 
-def test_prefix_materialize():
-    result = dg.materialize(dg.load_assets_from_current_module(key_prefix="foo"))  # pyright: ignore[reportArgumentType]
+def test_prefix_materialize(prefixed_materialize_result):
+    mats, checks = prefixed_materialize_result.get_asset_events_summary()
 
-    assert len(result.get_asset_materialization_events()) == 1
-    assert result.get_asset_materialization_events()[0].asset_key == dg.AssetKey(
-        ["foo", "my_asset"]
-    )
-    assert len(result.get_asset_check_evaluations()) == 1
-    assert result.get_asset_check_evaluations()[0].asset_key == dg.AssetKey(["foo", "my_asset"])
+    assert len(mats) == 1
+    assert mats[0].asset_key == _FOO_MY_KEY
+    assert len(checks) == 1
+    assert checks[0].asset_key == _FOO_MY_KEY
@@ -232,7 +232,7 @@ def test_load_from_definitions_from_module(
 
 
 @pytest.mark.parametrize(**ModuleScopeTestSpec.as_parametrize_kwargs(MODULE_TEST_SPECS))
-@patch("dagster._core.definitions.module_loaders.load_defs_from_module.inspect.getmodule")
+@patch("dagster._core.definitions.module_loaders.utils.inspect.getmodule")
 def test_load_from_definitions_from_current_module(
     mock_getmodule: MagicMock, objects: Mapping[str, Any], error_expected: bool
 ) -> None:
@@ -268,6 +268,38 @@ def my_job():
     ]
 
 
+def test_asset_events_summary():
+    @dg.asset(check_specs=[dg.AssetCheckSpec(name="my_check", asset="my_asset")])
+    def my_asset():
+        return dg.MaterializeResult(check_results=[dg.AssetCheckResult(passed=True)])
+
+    result = dg.materialize([my_asset])
+    summary = result.get_asset_events_summary()
+
+    assert summary.materialization_events == result.get_asset_materialization_events()
+    assert summary.check_evaluations == result.get_asset_check_evaluations()
+    assert len(summary.materialization_events) == 1
+    assert len(summary.check_evaluations) == 1
+    assert summary.check_evaluations[0].check_name == "my_check"
+
+
+def test_count_and_first_event():
+    @dg.asset
+    def my_asset():
+        return 1
+
+    result = dg.materialize([my_asset])
+
+    assert result.count_events(dg.DagsterEventType.ASSET_MATERIALIZATION) == 1
+    assert result.count_events(dg.DagsterEventType.ASSET_OBSERVATION) == 0
+
+    first = result.first_event(dg.DagsterEventType.ASSET_MATERIALIZATION)
+    assert first is not None
+    assert first.asset_key == dg.AssetKey("my_asset")
+    assert first == result.get_asset_materialization_events()[0]
+    assert result.first_event(dg.DagsterEventType.ASSET_OBSERVATION) is None
+
+
 def test_dagster_run():
     @dg.op
     def success_op():
@@ -1,5 +1,5 @@
 from collections.abc import Mapping, Sequence
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, cast
 
 import polars as pl
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema, io_manager
@@ -7,6 +7,11 @@
 from dagster._core.definitions.metadata import RawMetadataValue, TableMetadataSet
 from dagster._core.storage.db_io_manager import DbIOManager, DbTypeHandler, TableSlice
 from dagster_snowflake.snowflake_io_manager import SnowflakeDbClient, SnowflakeIOManager
+from snowflake.connector.errorcode import ER_NO_ARROW_RESULT, ER_NO_PYARROW_SNOWSQL
+from snowflake.connector.errors import NotSupportedError, ProgrammingError
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 def _table_exists(table_slice: TableSlice, connection):
@@ -20,6 +25,36 @@ def _table_exists(table_slice: TableSlice, connection):
     return len(tables) > 0
 
 
+# Error codes the Snowflake connector raises when Arrow results aren't available on the platform
+_NO_ARROW_ERRNOS = (ER_NO_ARROW_RESULT, ER_NO_PYARROW_SNOWSQL)
+
+
+def _fetch_arrow_table(cursor) -> Optional["pa.Table"]:
+    """Fetches the results of the executed query as a PyArrow Table, if the cursor supports it.
+
+    Returns None, so that the caller falls back to fetching rows, if the cursor has no Arrow fetch
+    method, if the Snowflake connector can't return the result as Arrow (the result format is JSON,
+    e.g. via PYTHON_CONNECTOR_QUERY_RESULT_FORMAT, or Arrow isn't available on the platform), or if
+    the connector returned no result batches (it returns None rather than an empty table for empty
+    results).
+    """
+    if hasattr(cursor, "fetch_arrow_table"):
+        # ADBC cursor
+        return cursor.fetch_arrow_table()
+    if hasattr(cursor, "fetch_arrow_all"):
+        # snowflake-connector-python cursor
+        try:
+            return cursor.fetch_arrow_all()
+        except NotSupportedError:
+            # the result isn't in Arrow format
+            return None
+        except ProgrammingError as e:
+            if e.errno in _NO_ARROW_ERRNOS:
+                return None
+            raise
+    return None
+
+
 @beta
 class SnowflakePolarsTypeHandler(DbTypeHandler[pl.DataFrame]):
     """Plugin for the Snowflake I/O Manager that can store and load Polars DataFrames as Snowflake tables.
@@ -76,8 +111,9 @@ def handle_output(
             delete_stmt += " AND ".join(partition_conditions)
             connection.cursor().execute(delete_stmt)
 
-        # Write using Polars native write_database with ADBC
-        # This is more efficient than converting to pandas
+        # Write using Polars native write_database with ADBC. The Snowflake ADBC driver's bulk
+        # ingestion writes the Arrow data to Parquet files, PUTs them to a temporary stage and
+        # loads them with COPY INTO, rather than binding parameters row by row
 
         with connection.cursor() as cursor:
             cursor.execute(f"USE DATABASE {table_slice.database.upper()}")  # pyright: ignore[reportOptionalMemberAccess]
@@ -114,21 +150,26 @@ def load_input(
         if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
             return pl.DataFrame()
 
-        # Use Snowflake cursor to fetch data
-        cursor = connection.cursor()
-        cursor.execute(SnowflakeDbClient.get_select_statement(table_slice))
-
-        # Fetch all data and column names
-        data = cursor.fetchall()
-        columns = [desc[0].lower() for desc in cursor.description]
-
-        # Create Polars DataFrame from the fetched data
-        if data:
-            result = pl.DataFrame(data, schema=columns, orient="row")
-        else:
-            result = pl.DataFrame(schema=[(col, pl.Utf8) for col in columns])
-
-        return result
+        # Use Snowflake cursor to fetch data. The cursor is closed once the result is fetched so
+        # that the driver releases its result buffers before the next partition is loaded
+        with connection.cursor() as cursor:
+            cursor.execute(SnowflakeDbClient.get_select_statement(table_slice))
+
+            # Fetch the result in Arrow format so Polars can wrap the buffers without building a
+            # Python tuple per row
+            arrow_table = _fetch_arrow_table(cursor)
+            if arrow_table is not None:
+                result = cast("pl.DataFrame", pl.from_arrow(arrow_table, rechunk=False))
+                return result.rename({col: col.lower() for col in result.columns})
+
+            # Fall back to fetching rows for cursors without Arrow support
+            data = cursor.fetchall()
+            columns = [desc[0].lower() for desc in cursor.description]
+
+            # Create Polars DataFrame from the fetched data
+            if data:
+                return pl.DataFrame(data, schema=columns, orient="row")
+            return pl.DataFrame(schema=[(col, pl.Utf8) for col in columns])
 
     @property
     def supported_types(self):